@@ -0,0 +1,52 @@
+"""
+Optional compiled kernels for batch response decoding.
+
+NumPy is required for batch decoding, Numba is used when available
+and a vectorized NumPy implementation is used otherwise.
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+    @njit(cache=True, parallel=True)
+    def parse_frames(frames, crc_table, out_range, out_checksum):
+        """
+        Decodes an (N, 11) uint8 array of responses into range and checksum arrays.
+        Range is NaN for responses with a non-valid status.
+        """
+        for i in prange(frames.shape[0]):
+            offset = 0
+            for j in range(8):
+                offset += int(frames[i, j])
+            offset = (offset & 0xFF) * 2
+            out_checksum[i] = frames[i, 8] == crc_table[offset] and frames[i, 9] == crc_table[offset + 1]
+
+            if frames[i, 0] == 0x76:  # 'v'
+                value = 0
+                for j in range(1, 8):
+                    value = value * 10 + (int(frames[i, j]) - 0x30)
+                out_range[i] = value / 100
+            else:
+                out_range[i] = np.nan
+else:
+    def parse_frames(frames, crc_table, out_range, out_checksum):
+        """
+        Decodes an (N, 11) uint8 array of responses into range and checksum arrays.
+        Range is NaN for responses with a non-valid status.
+        """
+        offset = (frames[:, :8].sum(axis=1, dtype=np.intp) & 0xFF) * 2
+        out_checksum[:] = (frames[:, 8] == crc_table[offset]) & (frames[:, 9] == crc_table[offset + 1])
+
+        digits = frames[:, 1:8].astype(np.int64) - 0x30
+        powers = 10 ** np.arange(6, -1, -1, dtype=np.int64)
+        out_range[:] = np.where(frames[:, 0] == 0x76, (digits @ powers) / 100, np.nan)  # 'v'
@@ -0,0 +1,38 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional C implementation of the response hot path used by protocol.py.
+
+Build in place with: python setup.py build_ext --inplace
+"""
+
+cdef bytes _HEX_DIGITS = b"0123456789ABCDEF"
+
+
+cpdef bint crc_ok(const unsigned char[::1] response):
+    """
+    Checks the response checksum: low byte of the sum of the first 8 bytes,
+    sent as 2 uppercase hex characters.
+    """
+    cdef unsigned int total = 0
+    cdef Py_ssize_t i
+    cdef const unsigned char *digits = _HEX_DIGITS
+    if response.shape[0] < 10:
+        return False
+    for i in range(8):
+        total += response[i]
+    total &= 0xFF
+    return response[8] == digits[total >> 4] and response[9] == digits[total & 0x0F]
+
+
+cpdef double range_value(const unsigned char[::1] response) except? -1:
+    """
+    Converts the 7 ASCII range digits of a response (bytes 1-7) to meters.
+    Raises ValueError if the response is shorter than 8 bytes.
+    """
+    cdef long value = 0
+    cdef Py_ssize_t i
+    if response.shape[0] < 8:
+        raise ValueError("Invalid response format")
+    for i in range(1, 8):
+        value = value * 10 + (response[i] - 0x30)
+    return value / 100.0
@@ -1,5 +1,7 @@
 import enum
 import struct
+from functools import lru_cache
+from typing import NamedTuple, Optional
 
 START_OF_COMMAND = 0x3E  # "<" Start of command
 UPPER_CASE_LETTERS = range(0x41, 0x5a, 1)
@@ -10,72 +12,116 @@ END_OF_COMMAND = 0x0D
 VALID_COMMAND_RESPONSE = ACK = 0x3C
 INVALID_COMMAND_RESPONSE = NACK = 0x21
 
+RESPONSE_LEN = 11
+RANGE_REQUEST = b">Md1\r"  # Input command for range measurement
+
+# Response layout: status, 7 range digits, 2 hex checksum characters, '<CR>'
+_RESPONSE = struct.Struct(">c7s2sc")
+
+# Response status byte -> (status name, carries a valid range)
+_STATUS_MAP = {b'v': ("Valid", True), b'R': ("Error", False)}
+_STATUS_UNKNOWN = ("Unknown", False)
+
+# Uppercase hex pair for every checksum value
+_HEX2 = tuple(b"%02X" % i for i in range(256))
+_CRC_TABLE = b"".join(_HEX2)  # Flat 2 bytes per entry layout for the batch kernel
+
+
+# Precompiled struct layouts for extended command assembly
+_EXT_TWO = struct.Struct(">c2sdsdc")  # '>' (start), letters, digit, comma, second digit, '<CR>'
+_EXT_ONE = struct.Struct(">c2sdc")  # '>' (start), letters, digit, '<CR>'
+
+_START = b">"
+_END = b"\r"
+_COMMA = b","
+
+
+@lru_cache(maxsize=64)
+def _opcode(uppercase, lowercase):
+    """
+    Encode the two-letter command opcode, cached per letter pair.
+    """
+    return f"{uppercase}{lowercase}".encode('ascii')
+
+
+def range_value(response):
+    """
+    Converts the 7 ASCII range digits of a response (bytes 1-7) to meters.
+    Raises ValueError if the response is shorter than 8 bytes.
+    """
+    try:
+        return ((response[1] - 0x30) * 1000000
+                + (response[2] - 0x30) * 100000
+                + (response[3] - 0x30) * 10000
+                + (response[4] - 0x30) * 1000
+                + (response[5] - 0x30) * 100
+                + (response[6] - 0x30) * 10
+                + (response[7] - 0x30)) / 100
+    except IndexError:
+        raise ValueError("Invalid response format") from None
+
+
+def crc_ok(response):
+    """
+    Checks the response checksum: low byte of the sum of the first 8 bytes,
+    sent as 2 uppercase hex characters.
+    """
+    return _HEX2[sum(response[:8]) & 0xFF] == response[8:10]
+
+
+try:
+    # Compiled versions of the helpers above, see setup.py
+    from _speedups import crc_ok, range_value
+except ImportError:
+    pass
+
 
 class CommandBuilder:
-    def __init__(self):
-        # Format definitions for struct
-        self.base_format = ">c2scc"  # '>' (start), uppercase + lowercase letters, optional number, '<CR>'
-        self.extended_format = ">c2sdsdc"  # '>' (start), uppercase + lowercase letters, optional number,
-        # digit, optional comma, second digit, '<CR>'
 
     def build_basic_command(self, uppercase, lowercase, number=None):
         """
         Build a basic command structure.
         """
-        start = b">"
-        end = b"\r"
-        # Build the binary command
+        # Basic commands are plain ASCII, concatenation is cheaper than struct packing
+        opcode = _opcode(uppercase, lowercase)
         if number is not None:
-            number_bytes = str(number).encode('ascii')
-            packed_data = struct.pack(
-                self.base_format,
-                start,
-                f"{uppercase}{lowercase}".encode('ascii'),
-                number_bytes,
-                end
-            )
-        else:
-            packed_data = struct.pack(
-                ">c2sc",
-                start,
-                f"{uppercase}{lowercase}".encode('ascii'),
-                end
-            )
-        return packed_data
+            return _START + opcode + str(number).encode('ascii') + _END
+        return _START + opcode + _END
 
     def build_extended_command(self, uppercase, lowercase, first_param, second_param=None):
         """
         Build an extended command structure.
         """
-        start = b">"
-        end = b"\r"
-        comma = b"," if second_param is not None else b""
         # Build the binary command
         if second_param is not None:
-            packed_data = struct.pack(
-                self.extended_format,
-                start,
-                f"{uppercase}{lowercase}".encode('ascii'),
+            return _EXT_TWO.pack(
+                _START,
+                _opcode(uppercase, lowercase),
                 float(first_param),
-                comma,
+                _COMMA,
                 float(second_param),
-                end,
+                _END,
             )
-        else:
-            packed_data = struct.pack(
-                ">c2sdsc",  # Format without the second parameter and comma
-                start,
-                f"{uppercase}{lowercase}".encode('ascii'),
-                float(first_param),
-                end,
-            )
-        return packed_data
+        return _EXT_ONE.pack(
+            _START,
+            _opcode(uppercase, lowercase),
+            float(first_param),
+            _END,
+        )
+
+
+class RangeResult(NamedTuple):
+    """
+    Parsed distance measurement response, use ._asdict() for a dict view.
+    """
+    status: str
+    range: Optional[float]  # Meters, None unless the status is valid
+    error: Optional[bytes]  # Error code, None for valid responses
+    checksum_ok: bool
 
 
 class DistanceMeasurement:
-    def __init__(self):
-        # Input command for range measurement
-        self.range_request = ">Md1\r".encode('ascii')
+    __slots__ = ()
 
     @staticmethod
     def parse_response(response):
@@ -89,49 +135,60 @@ class DistanceMeasurement:
         4. <CR> (1 byte): End character (ASCII 0x0D).
 
         Each response line is 11 characters.
+        Returns a RangeResult.
         """
-        if len(response) != 11 or response[-1] != 0x0D:  # Validate response length and <CR> at the end
+        # Unpack the response, validating its length and <CR> at the end
+        try:
+            status, measured_range, _, end = _RESPONSE.unpack(response)
+        except struct.error:
+            raise ValueError("Invalid response format") from None
+        if end != _END:
             raise ValueError("Invalid response format")
 
-        # Unpack the response
-        status, measured_range, checksum = response[0:1], response[1:8], response[8:10]
-
-        # Convert checksum to hexadecimal
-        # checksum_value = int(checksum.decode('ascii'), 16)
-
-        measured_range_value = None
-        error_code = None
         # Interpret status
-        if status == b'v':
-            range_status = "Valid"
-            measured_range_value = int(measured_range.decode('ascii')) / 100
-        elif status == b'R':
-            range_status = "Error"
-            error_code = response[4:8]
-        else:
-            range_status = "Unknown"
-            error_code = response[4:8]
-
-        # Convert range value to integer
-
-        return {
-            "Status": range_status,
-            "Measured Range": measured_range_value or error_code,  # Convert to meters
-            "Checksum": DistanceMeasurement.check_crc(response),
-        }
+        range_status, is_valid = _STATUS_MAP.get(status, _STATUS_UNKNOWN)
+
+        return RangeResult(
+            range_status,
+            range_value(response) if is_valid else None,
+            None if is_valid else measured_range[3:],
+            crc_ok(response),
+        )
 
     @staticmethod
     def check_crc(response: bytes):
-        # Extract the data and CRC from the response
-        data = response[:8]
-        crc_received = response[-3:-1].decode('utf-8')  # Decode received CRC
+        return crc_ok(response)
+
 
-        # Calculate the CRC from the data
-        crc_calculated = f"{sum(data) & 0xFF:02X}"  # Convert to 2-character hex
-        return crc_calculated == crc_received
+def parse_responses_batch(buf):
+    """
+    Parses a buffer of back-to-back 11-byte responses in a single pass.
 
+    Returns a NumPy structured array with "status" (S1), "range" (float, meters,
+    NaN unless the status is valid) and "checksum" (bool) fields.
+    Requires NumPy, the decoding loop is JIT compiled when Numba is installed.
+    """
+    # Imported here so the single response path does not load NumPy/Numba
+    from _jit import np, parse_frames
 
+    if np is None:
+        raise ImportError("parse_responses_batch requires NumPy")
+    if len(buf) % RESPONSE_LEN:
+        raise ValueError("Invalid response format")
 
+    frames = np.frombuffer(buf, dtype=np.uint8).reshape(-1, RESPONSE_LEN)
+    if (frames[:, -1] != END_OF_COMMAND).any():  # Validate <CR> at the end of every response
+        raise ValueError("Invalid response format")
+
+    result = np.empty(len(frames), dtype=[("status", "S1"), ("range", "f8"), ("checksum", "?")])
+    out_range = np.empty(len(frames), dtype=np.float64)
+    out_checksum = np.empty(len(frames), dtype=np.bool_)
+    parse_frames(frames, np.frombuffer(_CRC_TABLE, dtype=np.uint8), out_range, out_checksum)
+
+    result["status"] = frames[:, 0].view("S1")
+    result["range"] = out_range
+    result["checksum"] = out_checksum
+    return result
 
 
 def check_base_command_build(builder):
@@ -157,14 +214,14 @@ def check_extended_command_build(builder):
 
 def check_responses(builder, parser):
     range_command = builder.build_basic_command(*'Md1')
-    print("Range Command:", range_command, range_command == b'>Md1\r')
+    print("Range Command:", range_command, range_command == RANGE_REQUEST)
 
     strongest_return = b'v0108750DB\r'
     second_strongest_return = b'R000E301BB\r'
     weakest_return = b'R000E301BB\r'
     print("Range command response",
           parser.parse_response(strongest_return),
-          parser.parse_response(strongest_return)["Measured Range"] == 1087.5)
+          parser.parse_response(strongest_return).range == 1087.5)
     print("Range command response", parser.parse_response(b'v1234550DA\r'))
     print("Range command response", parser.parse_response(b'v0222200CE\r'))
     print("Range command response", parser.parse_response(second_strongest_return))
@@ -177,6 +234,5 @@ if __name__ == "__main__":
     parser = DistanceMeasurement()
 
     check_base_command_build(builder)
+    check_extended_command_build(builder)
     check_responses(builder, parser)
-
-    # check_extended_command_build(builder)
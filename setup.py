@@ -0,0 +1,15 @@
+"""
+Builds the optional C speedups for protocol.py:
+
+    python setup.py build_ext --inplace
+
+protocol.py falls back to its pure Python implementation when the extension is not built.
+"""
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(
+    name="vectronix-lrf",
+    py_modules=["protocol", "vectronix", "_jit"],
+    ext_modules=cythonize("_speedups.pyx"),
+)
@@ -1,4 +1,7 @@
 import enum
+from functools import lru_cache
+
+from protocol import crc_ok, range_value
 
 RANGING_RESPONSE_LEN = 11
 ACK = b'>'  # 0x3E
@@ -7,19 +10,24 @@ END = b'\r'  # 0x0D
 COMMA = b","  # 0x2c
 
 
-class Command(enum.Enum, bytes):
+class Command(bytes, enum.Enum):
     GET_RANGE = b"Md1"
     SW_HW_INFO = b"Iv1"
     SELF_TEST = b"Tb1"
     LPCL_MODE = b"Tl1"
 
 
-class RangingStatus(enum.Enum, bytes):
+class RangingStatus(bytes, enum.Enum):
     VALID = b'v'
     ERROR = b'R'
     UNKNOWN = 0
 
 
+# Raw status byte values, compared directly instead of going through the enum
+_VALID = RangingStatus.VALID.value[0]
+_ERROR = RangingStatus.ERROR.value[0]
+
+
 class LPCLMode(enum.IntEnum):
     DEACTIVATE = 0
     LEVEL_1 = 1
@@ -30,71 +38,144 @@ class LPCLMode(enum.IntEnum):
     LEVEL_6 = 6
 
 
+# Encoded ",<level>" parameter for every LPCL mode, indexed by mode
+_LPCL_BYTES = tuple(COMMA + b"%d" % mode for mode in LPCLMode)
+
+
+@lru_cache(maxsize=64)
+def _build_command(command: Command, lpcl_mode: LPCLMode = None):
+    """
+    Builds the command buffer, cached so repeated sends reuse one bytes object.
+    """
+    # LPCLMode() rejects out of range levels, a raw int would silently wrap on negative indexing
+    opcode = _LPCL_BYTES[LPCLMode(lpcl_mode)] if lpcl_mode is not None else b""
+    return ACK + command + opcode + END
+
+
 class VectronixRangeFinder:
     def __init__(self, read, write):
         self._read = read
         self._write = write
+        # Received bytes not consumed yet, kept between calls so a following frame is not lost
+        self._rx = bytearray()
 
     def send_command(self, command: Command, lpcl_mode: LPCLMode = None):
-        opcode = COMMA + str(lpcl_mode).encode('ascii') if lpcl_mode else b""
-        buffer = ACK + command + opcode + END
-        self._write(buffer)
+        self._write(_build_command(command, lpcl_mode))
 
     def read_response(self):
+        rx = self._rx
+        if rx:
+            return self._read_buffered()
+
+        # Nothing left over from a previous call, read straight from the port
         while True:
             response = self._read(1)
-            if response == END:
-                continue
-            if response == NACK:
-                raise ValueError("Invalid command")
             if response == ACK:
                 response += self._read(RANGING_RESPONSE_LEN - 1)
-                if len(response) != 11 or response[-1] != 0x0D:  # Validate response length and <CR> at the end
+                if len(response) != RANGING_RESPONSE_LEN:
                     raise ValueError("Invalid response format")
+                if response[-1] != 0x0D:  # Validate <CR> at the end
+                    rx += response[1:]  # Drop only the bad ACK, a real frame may start inside these bytes
+                    raise ValueError("Invalid response format")
+                return response
+            if response == NACK:
+                raise ValueError("Invalid command")
+            if not response:
+                return b""
+            # Line endings or noise before the frame, skip
+
+    def _read_buffered(self):
+        rx = self._rx
+        while True:
+            start = rx.find(ACK)
+            nack = rx.find(NACK, 0, len(rx) if start == -1 else start)
+            if nack != -1:
+                del rx[:nack + 1]
+                raise ValueError("Invalid command")
 
-            return response
+            if start == -1:
+                rx.clear()  # Only line endings or noise, nothing to keep
+                # No frame started yet, read byte by byte so a NACK is reported as soon as it arrives
+                missing = 1
+            else:
+                del rx[:start]
+                missing = RANGING_RESPONSE_LEN - len(rx)
+                if missing <= 0:
+                    if rx[RANGING_RESPONSE_LEN - 1] != 0x0D:  # Validate <CR> at the end
+                        del rx[:1]  # Drop only the bad ACK, a real frame may start inside these bytes
+                        raise ValueError("Invalid response format")
+                    response = bytes(rx[:RANGING_RESPONSE_LEN])
+                    del rx[:RANGING_RESPONSE_LEN]
+                    return response
+
+            # Read only what the current frame still needs, so blocking reads do not wait for more
+            chunk = self._read(missing)
+            if not chunk:
+                if rx:
+                    rx.clear()
+                    raise ValueError("Invalid response format")
+                return b""
+            rx += chunk
 
     @staticmethod
     def parse_range(response: bytes):
-        status, measured_range, checksum = response[0:1], response[1:8], response[8:10]
+        status = response[0]
 
         VectronixRangeFinder.check_crc(response)
 
-        response = {
-            'range': None,
-            'status': None,
-            'error': None,
-        }
-
-        if status == RangingStatus.VALID:
-            response = {
-                'range': int(measured_range.decode('ascii')) / 100,
+        if status == _VALID:
+            return {
+                'range': range_value(response),
                 'status': RangingStatus.VALID,
                 'error': None,
             }
-        else:
-            response = {
-                'range': None,
-                'status': status == RangingStatus.ERROR or RangingStatus.UNKNOWN,
-                'error': response[4:8],
-            }
-
-        return response
+        return {
+            'range': None,
+            'status': RangingStatus.ERROR if status == _ERROR else RangingStatus.UNKNOWN,
+            'error': response[4:8],
+        }
 
     @staticmethod
     def check_crc(response: bytes):
-        # Extract the data and CRC from the response
-        data = response[:8]
-        crc_received = response[-3:-1].decode('utf-8')  # Decode received CRC
-
-        # Calculate the CRC from the data
-        crc_calculated = f"{sum(data) & 0xFF:02X}"  # Convert to 2-character hex
-        # return crc_calculated == crc_received
-        if not crc_received == crc_calculated:
+        if not crc_ok(response):
             raise ValueError("Invalid CRC")
 
 
+def check_read_response():
+    import io
+
+    def finder(data):
+        return VectronixRangeFinder(io.BytesIO(data).read, None)
+
+    # Line ending noise and back-to-back frames
+    lrf = finder(b'\r\r>0108750DB\r>0222200CE\r')
+    print("Read response", lrf.read_response(), lrf.read_response(), lrf.read_response())
+
+    # NACK is reported without waiting for a full frame
+    for data in (b'!', b'\r!'):
+        try:
+            finder(data).read_response()
+        except ValueError as error:
+            print("Read response", data, error)
+
+    # Truncated frame
+    try:
+        finder(b'>0108750D').read_response()
+    except ValueError as error:
+        print("Read response truncated", error)
+
+    # Frame without <CR> followed by a real frame resyncs on the next ACK
+    lrf = finder(b'>01>0108750DB\r')
+    try:
+        lrf.read_response()
+    except ValueError as error:
+        print("Read response bad frame", error)
+    print("Read response resync", lrf.read_response())
+
+
 if __name__ == "__main__":
+    check_read_response()
+
     import serial
 
     uart = serial.Serial(timeout=1)